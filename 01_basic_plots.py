@@ -3,26 +3,38 @@ Basic Bokeh Plotting Examples
 This file demonstrates fundamental plotting capabilities in Bokeh.
 """
 
+from functools import lru_cache
+
 import numpy as np
 from bokeh.plotting import figure, show, save, output_file
-from bokeh.models import HoverTool
+from bokeh.models import ColumnDataSource, HoverTool
 from bokeh.layouts import column, row
 from bokeh.io import curdoc
 
-# Generate sample data
-x = np.linspace(0, 4*np.pi, 100)
-y = np.sin(x)
-y2 = np.cos(x)
+@lru_cache(maxsize=8)
+def trig_grid(n, period):
+    """Return n float32 points on [0, period] with their sine and cosine (read-only, cached)"""
+    x = np.linspace(0, period, n, dtype=np.float32)
+    grid = (x, np.sin(x), np.cos(x))
+    for array in grid:
+        array.setflags(write=False)
+    return grid
 
-# Sample data for scatter plot
-N = 100
-colors = np.random.choice(['red', 'green', 'blue', 'orange', 'purple'], N)
-x_scatter = np.random.random(N) * 100
-y_scatter = np.random.random(N) * 100
-sizes = np.random.randint(10, 30, N)
+@lru_cache(maxsize=None)
+def scatter_data(N=100):
+    """Generate the sample scatter data once; seeded so it is reproducible between runs"""
+    rng = np.random.default_rng(0)
+    colors = rng.choice(['red', 'green', 'blue', 'orange', 'purple'], size=N)
+    x_scatter, y_scatter = rng.uniform(0, 100, size=(2, N))
+    sizes = rng.integers(10, 30, size=N)
+    for array in (colors, x_scatter, y_scatter, sizes):
+        array.setflags(write=False)
+    return x_scatter, y_scatter, sizes, colors
 
 def create_line_plot():
     """Create a basic line plot with multiple lines"""
+    x, y, y2 = trig_grid(100, 4*np.pi)
+    
     p = figure(title="Line Plot Example", 
                x_axis_label='x', 
                y_axis_label='y',
@@ -41,6 +53,8 @@ def create_line_plot():
 
 def create_scatter_plot():
     """Create a scatter plot with hover tooltips"""
+    x_scatter, y_scatter, sizes, colors = scatter_data()
+    
     p = figure(title="Scatter Plot with Hover", 
                x_axis_label='X Value', 
                y_axis_label='Y Value',
@@ -84,9 +98,8 @@ def create_bar_chart():
 
 def create_area_plot():
     """Create an area plot"""
-    x_area = np.linspace(0, 2*np.pi, 50)
-    y1 = np.sin(x_area)
-    y2 = np.sin(x_area) + 1
+    x_area, y1, _ = trig_grid(50, 2*np.pi)
+    y2 = y1 + 1
     
     p = figure(title="Area Plot Example",
                x_axis_label='x', 
@@ -95,9 +108,11 @@ def create_area_plot():
                height=400)
     
     # Create area between two curves
-    p.varea(x=x_area, y1=y1, y2=y2, alpha=0.5, color='lightblue')
-    p.line(x_area, y1, line_width=2, color='blue')
-    p.line(x_area, y2, line_width=2, color='red')
+    source = ColumnDataSource(data=dict(x=x_area, y1=y1, y2=y2))
+    p.varea(x='x', y1='y1', y2='y2', source=source, alpha=0.5, color='lightblue')
+    
+    # Both outlines in a single multi_line renderer, one row per curve
+    p.multi_line(xs=[x_area, x_area], ys=[y1, y2], color=['blue', 'red'], line_width=2)
     
     return p
 
@@ -3,22 +3,41 @@ Interactive Bokeh Visualization Examples
 This file demonstrates interactive features like widgets, callbacks, and dynamic updates.
 """
 
+from functools import lru_cache
+
 import numpy as np
 from bokeh.plotting import figure, show, curdoc
 from bokeh.models import (ColumnDataSource, HoverTool, Select, Slider, 
-                         Button, CheckboxGroup, RadioGroup, Div)
+                         Button, CheckboxGroup, RadioGroup, Div, LinearColorMapper)
 from bokeh.layouts import column, row
 from bokeh.io import output_file
-from bokeh.transform import factor_cmap
+from bokeh.transform import factor_cmap, transform
 from bokeh.palettes import Category10
 
+# Seeded generator so the plots are reproducible between runs
+rng = np.random.default_rng(0)
+
+@lru_cache(maxsize=8)
+def trig_grid(n, period):
+    """Return n float32 points on [0, period] with their sine and cosine (read-only, cached)"""
+    x = np.linspace(0, period, n, dtype=np.float32)
+    grid = (x, np.sin(x), np.cos(x))
+    for array in grid:
+        array.setflags(write=False)
+    return grid
+
+def index_color_mapper(palette):
+    """Color mapper that maps integer index i to palette[i]"""
+    return LinearColorMapper(palette=list(palette), low=-0.5, high=len(palette) - 0.5)
+
 def create_interactive_sine_wave():
     """Create an interactive sine wave with frequency and amplitude controls"""
-    # Initial data
-    x = np.linspace(0, 4*np.pi, 100)
-    y = np.sin(x)
+    # Initial data (float32 arrays are sent to the browser as binary buffers)
+    x, sinx, cosx = trig_grid(100, 4*np.pi)
+    y = sinx.copy()
     
-    source = ColumnDataSource(data=dict(x=x, y=y))
+    # sinx/cosx hold sin(freq*x) and cos(freq*x) for the current frequency
+    source = ColumnDataSource(data=dict(x=x, y=y, sinx=sinx, cosx=cosx))
     
     # Create plot
     p = figure(title="Interactive Sine Wave", 
@@ -43,9 +62,33 @@ def create_interactive_sine_wave():
     
     const x = data['x'];
     const y = data['y'];
+    const sinx = data['sinx'];
+    const cosx = data['cosx'];
+    
+    // The sin/cos tables only depend on the frequency, so only rebuild
+    // them when the frequency slider moves. x is evenly spaced from 0, so
+    // each entry follows from the previous one by the angle addition
+    // recurrence; s and c stay in doubles to keep rounding from building up
+    if (cb_obj === freq_slider) {
+        const dx = (x[x.length - 1] - x[0]) / (x.length - 1);
+        const cd = Math.cos(freq * dx);
+        const sd = Math.sin(freq * dx);
+        let s = 0.0;
+        let c = 1.0;
+        for (let i = 0; i < x.length; i++) {
+            sinx[i] = s;
+            cosx[i] = c;
+            const s_next = s * cd + c * sd;
+            c = c * cd - s * sd;
+            s = s_next;
+        }
+    }
     
+    // amp * sin(freq*x + phase) via the sine addition identity
+    const cp = amp * Math.cos(phase);
+    const sp = amp * Math.sin(phase);
     for (let i = 0; i < x.length; i++) {
-        y[i] = amp * Math.sin(freq * x[i] + phase);
+        y[i] = cp * sinx[i] + sp * cosx[i];
     }
     
     source.change.emit();
@@ -67,15 +110,12 @@ def create_interactive_sine_wave():
 def create_selection_plot():
     """Create a plot with selection and highlighting"""
     N = 200
-    x = np.random.random(N) * 100
-    y = np.random.random(N) * 100
-    colors = np.random.choice(['red', 'green', 'blue', 'orange'], N)
+    x, y = rng.uniform(0, 100, size=(2, N))
+    # Colors are sent as int8 indices into the palette instead of per-point strings
+    palette = ['red', 'green', 'blue', 'orange']
+    colors = rng.integers(0, len(palette), size=N, dtype=np.int8)
     
-    source = ColumnDataSource(data=dict(
-        x=x, y=y, colors=colors,
-        alpha=[0.6]*N,
-        size=[15]*N
-    ))
+    source = ColumnDataSource(data=dict(x=x, y=y, colors=colors))
     
     p = figure(title="Selection and Highlighting", 
                tools="pan,wheel_zoom,box_select,lasso_select,reset",
@@ -83,9 +123,9 @@ def create_selection_plot():
                height=400)
     
     circles = p.scatter('x', 'y', 
-                       color='colors', 
-                       size='size',
-                       alpha='alpha',
+                       color=transform('colors', index_color_mapper(palette)), 
+                       size=15,
+                       alpha=0.6,
                        source=source,
                        selection_color='red',
                        nonselection_alpha=0.2)
@@ -102,14 +142,14 @@ def create_data_table_plot():
     
     # Sample data
     countries = ['USA', 'China', 'Japan', 'Germany', 'India', 'UK', 'France', 'Brazil']
-    gdp = [21.43, 14.34, 4.94, 3.85, 2.87, 2.83, 2.72, 1.87]  # in trillions
-    population = [331, 1439, 126, 83, 1380, 67, 65, 213]  # in millions
+    gdp = np.array([21.43, 14.34, 4.94, 3.85, 2.87, 2.83, 2.72, 1.87])  # in trillions
+    population = np.array([331, 1439, 126, 83, 1380, 67, 65, 213], dtype=np.int32)  # in millions
     
     source = ColumnDataSource(data=dict(
         countries=countries,
         gdp=gdp,
         population=population,
-        gdp_per_capita=[g*1000000/p for g, p in zip(gdp, population)]
+        gdp_per_capita=gdp * 1000000 / population
     ))
     
     # Create scatter plot
@@ -150,9 +190,9 @@ def create_crossfilter_plot():
     """Create linked plots that filter each other"""
     # Generate sample data
     N = 300
-    x = np.random.normal(0, 1, N)
-    y = np.random.normal(0, 1, N)
-    colors = np.random.choice(['red', 'green', 'blue'], N)
+    x, y = rng.standard_normal((2, N))
+    palette = ['red', 'green', 'blue']
+    colors = rng.integers(0, len(palette), size=N, dtype=np.int8)
     
     source = ColumnDataSource(data=dict(x=x, y=y, colors=colors))
     
@@ -163,7 +203,7 @@ def create_crossfilter_plot():
                 height=300)
     
     p1.scatter('x', 'y', 
-               color='colors', 
+               color=transform('colors', index_color_mapper(palette)), 
                size=8, 
                alpha=0.6,
                source=source,
@@ -177,6 +217,7 @@ def create_crossfilter_plot():
     
     # Create histogram data
     hist, edges = np.histogram(x, bins=20)
+    hist, edges = hist.astype(np.int32), edges.astype(np.float32)
     hist_source = ColumnDataSource(data=dict(
         top=hist,
         left=edges[:-1],
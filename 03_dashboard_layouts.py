@@ -4,44 +4,56 @@ This file demonstrates how to create complex layouts and dashboards in Bokeh.
 """
 
 import numpy as np
-import pandas as pd
 from bokeh.plotting import figure, show, curdoc
 from bokeh.models import (ColumnDataSource, Select, Slider, Button, Div, 
-                         Panel, Tabs, DataTable, TableColumn)
+                         Panel, Tabs, DataTable, TableColumn, LinearColorMapper)
 from bokeh.layouts import column, row, gridplot
 from bokeh.io import output_file
 from bokeh.palettes import Category20, Spectral6
-from bokeh.transform import cumsum
+from bokeh.transform import cumsum, transform
 from math import pi
 
+# Seeded generator so the dashboards are reproducible between runs
+rng = np.random.default_rng(0)
+
+def index_color_mapper(palette):
+    """Color mapper that maps integer index i to palette[i]"""
+    return LinearColorMapper(palette=list(palette), low=-0.5, high=len(palette) - 0.5)
+
 def create_financial_dashboard():
     """Create a financial dashboard with multiple charts"""
     # Generate sample financial data
-    dates = pd.date_range('2023-01-01', periods=100, freq='D')
-    prices = 100 + np.cumsum(np.random.randn(100) * 0.5)
-    volume = np.random.randint(1000, 10000, 100)
+    dates = np.datetime64('2023-01-01') + np.arange(100)  # daily datetime64[D]
+    prices = 100 + np.cumsum(rng.standard_normal(100) * 0.5)
+    volume = rng.integers(1000, 10000, size=100, dtype=np.int32)
     
-    # Create main price chart
+    # Create moving average
+    window = 10
+    kernel = np.full(window, 1.0 / window)
+    # Pad the front with NaN so the first full window lines up with its end date
+    moving_avg = np.concatenate([np.full(window - 1, np.nan),
+                                 np.convolve(prices, kernel, mode='valid')])
+    
+    # Create main price chart; price, markers and moving average share one source
     p1 = figure(title="Stock Price", x_axis_type='datetime', 
                 width=800, height=300, tools="pan,wheel_zoom,reset")
-    p1.line(dates, prices, line_width=2, color='blue')
-    p1.circle(dates, prices, size=3, color='blue', alpha=0.5)
+    price_source = ColumnDataSource(data=dict(dates=dates, prices=prices,
+                                           moving_avg=moving_avg.astype(np.float32)))
+    p1.line('dates', 'prices', source=price_source, line_width=2, color='blue')
+    p1.scatter('dates', 'prices', source=price_source, size=3, color='blue', alpha=0.5)
+    p1.line('dates', 'moving_avg', source=price_source, line_width=2, color='red', 
+            legend_label=f'{window}-day MA', line_dash='dashed')
     
     # Create volume chart
     p2 = figure(title="Trading Volume", x_axis_type='datetime',
                 width=800, height=200, tools="pan,wheel_zoom,reset")
     p2.vbar(x=dates, top=volume, width=0.8, color='green', alpha=0.7)
     
-    # Create moving average
-    window = 10
-    moving_avg = pd.Series(prices).rolling(window=window).mean()
-    p1.line(dates, moving_avg, line_width=2, color='red', 
-            legend_label=f'{window}-day MA', line_dash='dashed')
-    
     # Create price distribution histogram
     p3 = figure(title="Price Distribution", width=300, height=300,
                 tools="pan,wheel_zoom,reset")
     hist, edges = np.histogram(prices, bins=20)
+    hist, edges = hist.astype(np.int32), edges.astype(np.float32)
     p3.quad(top=hist, bottom=0, left=edges[:-1], right=edges[1:],
             fill_color='navy', alpha=0.7)
     
@@ -83,8 +95,9 @@ def create_sales_dashboard():
     # Monthly sales line chart
     p1 = figure(title="Monthly Sales Trend", x_range=months,
                 width=400, height=300, tools="pan,wheel_zoom,reset")
-    p1.line(months, sales_by_month, line_width=3, color='blue')
-    p1.circle(months, sales_by_month, size=8, color='blue')
+    monthly_source = ColumnDataSource(data=dict(months=months, sales=sales_by_month))
+    p1.line('months', 'sales', source=monthly_source, line_width=3, color='blue')
+    p1.scatter('months', 'sales', source=monthly_source, size=8, color='blue')
     p1.y_range.start = 0
     
     # Product sales bar chart
@@ -100,37 +113,36 @@ def create_sales_dashboard():
                 tooltips="@products: @value (@percent%)")
     
     # Calculate pie chart data
-    colors = Category20[len(products)]
-    start_angle = 0
-    for i, (product, angle, color) in enumerate(zip(products, angles, colors)):
-        end_angle = start_angle + angle
-        p3.wedge(x=0, y=0, radius=0.8, start_angle=start_angle, 
-                end_angle=end_angle, color=color, alpha=0.8,
-                legend_label=product)
-        start_angle = end_angle
-    
-    # Heatmap of sales by month and product
-    months_rep = []
-    products_rep = []
-    sales_values = []
-    
-    for month in months:
-        for product in products:
-            months_rep.append(month)
-            products_rep.append(product)
-            sales_values.append(np.random.randint(20, 100))
+    pie_source = ColumnDataSource(data=dict(
+        products=products,
+        value=product_sales,
+        percent=np.round(np.asarray(product_sales) / sum(product_sales) * 100, 1),
+        angle=np.asarray(angles),
+        color=list(Category20[len(products)])
+    ))
+    
+    # One wedge renderer for all slices; cumsum turns the angles into start/end
+    p3.wedge(x=0, y=0, radius=0.8, source=pie_source,
+             start_angle=cumsum('angle', include_zero=True), end_angle=cumsum('angle'),
+             color='color', alpha=0.8, legend_field='products')
+    
+    # Heatmap of sales by month and product (one row per month, product pair)
+    sales_values = rng.integers(20, 100, size=(len(months), len(products))).ravel()
+    months_rep = np.repeat(months, len(products)).tolist()
+    products_rep = np.tile(products, len(months)).tolist()
+    color_idx = np.clip(sales_values // 20, 0, 5).astype(np.int8)
     
     p4 = figure(title="Sales Heatmap", x_range=months, y_range=products,
                 width=400, height=300, tools="hover",
                 tooltips=[('Month-Product', '@x @y'), ('Sales', '@sales')])
     
     source = ColumnDataSource(data=dict(
-        x=months_rep, y=products_rep, sales=sales_values,
-        colors=[Spectral6[min(5, max(0, int(val/20)))] for val in sales_values]
+        x=months_rep, y=products_rep, sales=sales_values.astype(np.int32),
+        colors=color_idx
     ))
     
     p4.rect(x='x', y='y', width=1, height=1, source=source,
-            fill_color='colors', line_color=None)
+            fill_color=transform('colors', index_color_mapper(Spectral6)), line_color=None)
     
     # Layout in grid
     grid = gridplot([[p1, p2], [p3, p4]], sizing_mode='scale_width')
@@ -140,17 +152,18 @@ def create_sales_dashboard():
 def create_tabbed_dashboard():
     """Create a dashboard with tabs"""
     # Tab 1: Overview
-    overview_data = np.random.randn(1000)
+    overview_data = rng.standard_normal(1000)
     p_overview = figure(title="Data Overview", width=600, height=400)
     hist, edges = np.histogram(overview_data, bins=50)
+    hist, edges = hist.astype(np.int32), edges.astype(np.float32)
     p_overview.quad(top=hist, bottom=0, left=edges[:-1], right=edges[1:],
                    fill_color='skyblue', alpha=0.7)
     
     tab1 = Panel(child=p_overview, title="Overview")
     
     # Tab 2: Time Series
-    dates = pd.date_range('2023-01-01', periods=365, freq='D')
-    values = np.cumsum(np.random.randn(365))
+    dates = np.datetime64('2023-01-01') + np.arange(365)
+    values = np.cumsum(rng.standard_normal(365))
     
     p_timeseries = figure(title="Time Series Data", x_axis_type='datetime',
                          width=600, height=400)
@@ -159,7 +172,7 @@ def create_tabbed_dashboard():
     tab2 = Panel(child=p_timeseries, title="Time Series")
     
     # Tab 3: Correlation Matrix
-    data = np.random.randn(100, 4)
+    data = rng.standard_normal((100, 4))
     corr_matrix = np.corrcoef(data.T)
     
     p_corr = figure(title="Correlation Matrix", 
@@ -167,29 +180,23 @@ def create_tabbed_dashboard():
                    y_range=['Var1', 'Var2', 'Var3', 'Var4'],
                    width=400, height=400)
     
-    # Create correlation heatmap
-    x_coords = []
-    y_coords = []
-    colors = []
-    correlations = []
-    
+    # Create correlation heatmap: one cell per (row variable, column variable) pair
     variables = ['Var1', 'Var2', 'Var3', 'Var4']
-    for i, var1 in enumerate(variables):
-        for j, var2 in enumerate(variables):
-            x_coords.append(var1)
-            y_coords.append(var2)
-            corr_val = corr_matrix[i, j]
-            correlations.append(corr_val)
-            # Color based on correlation strength
-            color_idx = int((corr_val + 1) * 2.5)  # Scale to 0-5
-            colors.append(Spectral6[min(5, max(0, color_idx))])
+    I, J = np.meshgrid(np.arange(len(variables)), np.arange(len(variables)), indexing='ij')
+    x_coords = np.array(variables)[I.ravel()].tolist()
+    y_coords = np.array(variables)[J.ravel()].tolist()
+    correlations = corr_matrix.ravel()
+    # Color based on correlation strength, scaled to 0-5
+    colors = np.clip(((corr_matrix + 1) * 2.5).astype(int), 0, 5).ravel().astype(np.int8)
     
     source = ColumnDataSource(data=dict(
-        x=x_coords, y=y_coords, colors=colors, correlations=correlations
+        x=x_coords, y=y_coords, colors=colors,
+        correlations=correlations.astype(np.float32)
     ))
     
     p_corr.rect(x='x', y='y', width=1, height=1, source=source,
-               fill_color='colors', line_color='white')
+               fill_color=transform('colors', index_color_mapper(Spectral6)),
+               line_color='white')
     
     # Add text annotations
     from bokeh.models import LabelSet